@@ -1,16 +1,12 @@
-import threading
-
 # Import DB initialization functions from our modules
 from project_tracker.db import init_db
 
-# Initialize the database and employees in separate threads
-db_thread = threading.Thread(target=init_db)
-db_thread.start()
-db_thread.join()
-
 import project_tracker.all_pages as all_pages
 import project_tracker.theme as theme
-from nicegui import ui
+from nicegui import app, ui
+
+# Initialize the database once, as part of the app's startup hooks
+app.on_startup(init_db)
 
 
 # # here we use our custom page decorator directly and just put the content creation into a separate function
@@ -1,12 +1,25 @@
 from nicegui import ui
-from project_tracker.project_tracker import status_updates_page, project_list_page
-from project_tracker.employee_management import employee_management_page
+
+
+# Page modules are imported on first visit, so a page that is never opened
+# (and the pandas import behind it) costs nothing at startup
+def status_updates() -> None:
+    from project_tracker.project_tracker import status_updates_page
+    status_updates_page()
+
+def project_list() -> None:
+    from project_tracker.project_tracker import project_list_page
+    project_list_page()
+
+def employee_management() -> None:
+    from project_tracker.employee_management import employee_management_page
+    employee_management_page()
 
 def create() -> None:
-    ui.page('/')(status_updates_page)
-    ui.page('/status-updates/')(status_updates_page)
-    ui.page('/projects/')(project_list_page)
-    ui.page('/employee-management/')(employee_management_page)
+    ui.page('/')(status_updates)
+    ui.page('/status-updates/')(status_updates)
+    ui.page('/projects/')(project_list)
+    ui.page('/employee-management/')(employee_management)
 
 if __name__ == '__main__':
     create()
\ No newline at end of file
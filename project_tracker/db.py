@@ -1,48 +1,90 @@
+import asyncio
+import atexit
+import concurrent.futures
 import sqlite3
+import threading
+from typing import Any, Callable, List, TypeVar
 from project_tracker.config import DATABASE
 
+T = TypeVar("T")
+
+# One connection per thread, opened lazily and kept for the life of the process
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+
 
 def get_connection() -> sqlite3.Connection:
-    return sqlite3.connect(DATABASE)
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        # check_same_thread=False only so close_connections() can close it at exit
+        conn = sqlite3.connect(DATABASE, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        _local.conn = conn
+        with _connections_lock:
+            _connections.append(conn)
+    return conn
+
+
+def close_connections() -> None:
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+
+
+atexit.register(close_connections)
+
+# Shared worker pool for blocking sqlite3 calls; its size also caps the number of open connections
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="db")
+
+
+# Run blocking sqlite3 work in the shared pool so async UI handlers keep the event loop free
+async def run_db(fn: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(_pool, fn, *args)
+
+
+SCHEMA_SQL: str = """
+-- Create projects table
+CREATE TABLE IF NOT EXISTS projects(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+
+-- Create project_status table
+CREATE TABLE IF NOT EXISTS project_status(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee TEXT NOT NULL,
+    project_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    commit_time TEXT NOT NULL,
+    projected_end_date TEXT NOT NULL
+);
+
+-- Indexes for the "not done" project lookups and the commit_time ordering of logs
+-- (projects.name is UNIQUE, which already indexes lookups by name)
+CREATE INDEX IF NOT EXISTS idx_ps_proj_status ON project_status(project_id, status);
+CREATE INDEX IF NOT EXISTS idx_ps_commit_time ON project_status(commit_time);
+
+-- Create employees table
+-- (UNIQUE(name) already backs ORDER BY name with a covering index, so no extra index is needed)
+CREATE TABLE IF NOT EXISTS employees(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+"""
 
 
 def init_db() -> None:
     conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Create projects table
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS projects(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE
-        );
-        """
-    )
-    
-    # Create project_status table
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS project_status(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            employee TEXT NOT NULL,
-            project_id INTEGER NOT NULL,
-            status TEXT NOT NULL,
-            commit_time TEXT NOT NULL,
-            projected_end_date TEXT NOT NULL
-        );
-        """
-    )
-    
-    # Create employees table
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS employees(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE
-        );
-        """
-    )
-    
-    conn.commit()
-    conn.close() 
\ No newline at end of file
+    # executescript runs in autocommit mode, so wrap the schema in one explicit transaction
+    try:
+        conn.executescript(f"BEGIN;\n{SCHEMA_SQL}\nCOMMIT;")
+    except sqlite3.Error:
+        conn.rollback()
+        raise
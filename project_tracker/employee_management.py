@@ -1,77 +1,184 @@
 # mypy: ignore_missing_imports
 
-from nicegui import ui
-from typing import List, Dict, Any, Optional
+from nicegui import background_tasks, ui
+from nicegui.events import ValueChangeEventArguments
+from typing import List, Dict, Optional, Set
+from functools import partial
+import asyncio
 import sqlite3
-from project_tracker.config import DATABASE
+import threading
 import project_tracker.theme as theme
-from project_tracker.db import get_connection
+from project_tracker.db import get_connection, run_db
+
+# Statements are module constants so every call hits sqlite3's per-connection statement cache
+SQL_INSERT_EMP_OR_IGNORE: str = "INSERT OR IGNORE INTO employees(name) VALUES (?)"
+SQL_INSERT_EMP_RETURNING: str = "INSERT INTO employees(name) VALUES (?) RETURNING id, name"
+SQL_DELETE_EMP: str = "DELETE FROM employees WHERE id = ? RETURNING id"
+SQL_FETCH_EMP: str = "SELECT id, name FROM employees ORDER BY name ASC"
+
+# Delay used to coalesce bursts of add/delete clicks into one table refresh
+REFRESH_DELAY: float = 0.05
 
 class EmployeeManager:
+    # Process-wide employee list shared by every page, kept in step with writes
+    _cache: Optional[List[sqlite3.Row]] = None
+    _cache_version: int = 0
+    _cache_lock = threading.Lock()
+
     def __init__(self) -> None:
         self.employee_name_input: Optional[ui.input] = None
         self.employees_container: Optional[ui.column] = None
+        self.bulk_names_input: Optional[ui.textarea] = None
+        self.selected_ids: Set[int] = set()
+        self._rows: Dict[int, ui.row] = {}
+        self._refresh_pending: Optional[asyncio.Task] = None
+        self._refresh_stale: bool = False
 
     @staticmethod
-    def init_employees() -> None:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS employees(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE
-            )
-            """
-        )
-        conn.commit()
-        conn.close()
+    def add_employee(name: str) -> None:
+        with EmployeeManager._cache_lock:
+            conn = get_connection()
+            with conn:
+                # RETURNING hands back the stored row, ready to go straight into the cache
+                new_row = conn.execute(SQL_INSERT_EMP_RETURNING, (name,)).fetchone()
+            if EmployeeManager._cache is not None:
+                EmployeeManager._cache.append(new_row)
+                EmployeeManager._cache.sort(key=lambda emp: emp["name"])
+            EmployeeManager._cache_version += 1
 
+    # Insert a batch of names; returns the ones skipped because they already exist
     @staticmethod
-    def add_employee(name: str) -> None:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO employees(name) VALUES (?)", (name,))
-        conn.commit()
-        conn.close()
+    def add_employees(names: List[str]) -> List[str]:
+        with EmployeeManager._cache_lock:
+            # Insert the whole batch in a single transaction (one commit instead of one per row)
+            placeholders = ",".join("?" * len(names))
+            conn = get_connection()
+            with conn:
+                existing = {row["name"] for row in conn.execute(f"SELECT name FROM employees WHERE name IN ({placeholders})", names)}
+                # OR IGNORE keeps one duplicate from rolling back the rest of the batch
+                inserted = conn.executemany(SQL_INSERT_EMP_OR_IGNORE, [(name,) for name in names if name not in existing]).rowcount
+            if inserted:
+                # executemany does not report the new ids, so reload on next fetch
+                EmployeeManager._cache = None
+                EmployeeManager._cache_version += 1
+            return [name for name in names if name in existing]
 
     @staticmethod
     def delete_employee(emp_id: int) -> None:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM employees WHERE id = ?", (emp_id,))
-        conn.commit()
-        conn.close()
+        with EmployeeManager._cache_lock:
+            conn = get_connection()
+            with conn:
+                deleted = conn.execute(SQL_DELETE_EMP, (emp_id,)).fetchone()
+            if deleted is None:
+                return
+            if EmployeeManager._cache is not None:
+                EmployeeManager._cache = [emp for emp in EmployeeManager._cache if emp["id"] != emp_id]
+            EmployeeManager._cache_version += 1
+
+    @staticmethod
+    def delete_employees(ids: List[int]) -> None:
+        if not ids:
+            return
+        with EmployeeManager._cache_lock:
+            # One DELETE ... IN (...) statement in one transaction instead of one per employee
+            placeholders = ",".join("?" * len(ids))
+            conn = get_connection()
+            with conn:
+                removed = {row["id"] for row in conn.execute(f"DELETE FROM employees WHERE id IN ({placeholders}) RETURNING id", ids)}
+            if not removed:
+                return
+            if EmployeeManager._cache is not None:
+                EmployeeManager._cache = [emp for emp in EmployeeManager._cache if emp["id"] not in removed]
+            EmployeeManager._cache_version += 1
+
+    @staticmethod
+    def fetch_employees() -> List[sqlite3.Row]:
+        with EmployeeManager._cache_lock:
+            if EmployeeManager._cache is None:
+                conn = get_connection()
+                cursor = conn.cursor()
+                cursor.execute(SQL_FETCH_EMP)
+                EmployeeManager._cache = cursor.fetchall()
+            return list(EmployeeManager._cache)
 
     @staticmethod
-    def fetch_employees() -> List[Dict[str, Any]]:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name FROM employees ORDER BY name ASC")
-        rows = cursor.fetchall()
-        conn.close()
-        return [{"id": row[0], "name": row[1]} for row in rows]
-
-    def update_employees_table(self) -> None:
+    def employees_version() -> int:
+        return EmployeeManager._cache_version
+
+    def update_employees_table(self, employees: Optional[List[sqlite3.Row]] = None) -> None:
         assert self.employees_container is not None, "employees_container is not set"
-        self.employees_container.clear()
-        for emp in EmployeeManager.fetch_employees():
-            with self.employees_container:
-                with ui.row().classes("items-center q-pa-xs"):
-                    ui.label(str(emp["id"]).strip()).classes("w-10")
-                    ui.label(emp["name"]).classes("w-40")
-                    ui.button("Delete", on_click=lambda e, emp_id=emp["id"]: self.delete_employee_and_update(emp_id)).classes("bg-red text-white q-ml-md")
-
-    def delete_employee_and_update(self, emp_id: int) -> None:
-        EmployeeManager.delete_employee(emp_id)
-        self.update_employees_table()
-
-    def add_employee_and_update(self, name: str) -> None:
+        if employees is None:
+            employees = EmployeeManager.fetch_employees()
+        # Only touch the rows that changed instead of rebuilding the whole list
+        current_ids = {emp["id"] for emp in employees}
+        for emp_id in [emp_id for emp_id in self._rows if emp_id not in current_ids]:
+            self._rows.pop(emp_id).delete()
+            self.selected_ids.discard(emp_id)
+        for index, emp in enumerate(employees):
+            if emp["id"] not in self._rows:
+                with self.employees_container:
+                    row = self.create_employee_row(emp)
+                if index < len(self._rows):
+                    row.move(target_index=index)
+                self._rows[emp["id"]] = row
+
+    def create_employee_row(self, emp: sqlite3.Row) -> ui.row:
+        with ui.row().classes("items-center q-pa-xs") as row:
+            ui.checkbox(on_change=partial(self.toggle_selected, emp["id"]))
+            ui.label(str(emp["id"]).strip()).classes("w-10")
+            ui.label(emp["name"]).classes("w-40")
+            ui.button("Delete", on_click=partial(self.delete_employee_and_update, emp["id"])).classes("bg-red text-white q-ml-md")
+        return row
+
+    def toggle_selected(self, emp_id: int, e: ValueChangeEventArguments) -> None:
+        if e.value:
+            self.selected_ids.add(emp_id)
+        else:
+            self.selected_ids.discard(emp_id)
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_pending is None:
+            self._refresh_pending = background_tasks.create(self._refresh_after_delay(), name="refresh employees")
+        else:
+            self._refresh_stale = True
+
+    async def _refresh_after_delay(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(REFRESH_DELAY)
+                # Writes scheduled from here on may miss this fetch, so they mark the table stale again
+                self._refresh_stale = False
+                self.update_employees_table(await run_db(EmployeeManager.fetch_employees))
+                if not self._refresh_stale:
+                    break
+        finally:
+            self._refresh_pending = None
+
+    async def delete_employee_and_update(self, emp_id: int) -> None:
+        await run_db(EmployeeManager.delete_employee, emp_id)
+        self._schedule_refresh()
+
+    async def delete_selected_and_update(self) -> None:
+        if self.selected_ids:
+            await run_db(EmployeeManager.delete_employees, sorted(self.selected_ids))
+            self._schedule_refresh()
+
+    async def add_employee_and_update(self, name: str) -> None:
         if name:
-            EmployeeManager.add_employee(name)
+            await run_db(EmployeeManager.add_employee, name)
             if self.employee_name_input is not None:
                 self.employee_name_input.value = ""
-            self.update_employees_table()
+            self._schedule_refresh()
+
+    async def add_employees_and_update(self, text: str) -> None:
+        names = list(dict.fromkeys(line.strip() for line in (text or "").splitlines() if line.strip()))
+        if names:
+            skipped = await run_db(EmployeeManager.add_employees, names)
+            if self.bulk_names_input is not None:
+                self.bulk_names_input.value = ""
+            if skipped:
+                ui.notify(f"Skipped existing employees: {', '.join(skipped)}", color="warning")
+            self._schedule_refresh()
 
     def create_ui(self) -> None:
         with theme.frame("Employee Management"):
@@ -82,6 +189,11 @@ class EmployeeManager:
                 assert self.employee_name_input is not None, "employee_name_input must be set"
                 temp_input = self.employee_name_input
                 ui.button("Add Employee", on_click=lambda e: self.add_employee_and_update(temp_input.value)).classes("q-mt-md")
+                self.bulk_names_input = ui.textarea("Paste Employee Names (one per line)")
+                assert self.bulk_names_input is not None, "bulk_names_input must be set"
+                bulk_input = self.bulk_names_input
+                ui.button("Add Employees", on_click=lambda e: self.add_employees_and_update(bulk_input.value)).classes("q-mt-md")
+                ui.button("Delete Selected", on_click=self.delete_selected_and_update).classes("bg-red text-white q-mt-md")
                 with ui.column() as container:
                     self.employees_container = container
                 self.update_employees_table()
@@ -1,28 +1,52 @@
 # mypy: ignore_missing_imports
 import datetime
-from typing import List, Dict, Any, cast
-from collections import defaultdict
+import functools
+import html
+import threading
+from typing import List, Dict, Any, FrozenSet, Optional
 import project_tracker.theme as theme
 import pandas as pd
 import plotly.express as px  # type: ignore
 from project_tracker.employee_management import EmployeeManager
 from nicegui import ui
-from project_tracker.db import get_connection, init_db
+from project_tracker.db import get_connection, run_db
+
+SQL_INSERT_LOG: str = """
+    INSERT INTO project_status(employee, project_id, status, commit_time, projected_end_date)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Bumped by every write to project_status so cached log reads know when to reload
+_logs_version: int = 0
+_logs_version_lock = threading.Lock()
+
+def _bump_logs_version() -> None:
+    global _logs_version
+    with _logs_version_lock:
+        _logs_version += 1
+
+# Bumped by every write to projects so the projects table knows when it is stale
+_projects_version: int = 0
+_projects_version_lock = threading.Lock()
+
+def _bump_projects_version() -> None:
+    global _projects_version
+    with _projects_version_lock:
+        _projects_version += 1
 
 # Create a new project
 def add_project(project_name: str) -> None:
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO projects(name) VALUES (?)", (project_name,))
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO projects(name) VALUES (?)", (project_name,))
+    _bump_projects_version()
 
 def fetch_projects() -> List[Dict[str, Any]]:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT id, name FROM projects")
     rows = cursor.fetchall()
-    conn.close()
     return [{"id": row[0], "name": row[1]} for row in rows]
 
 def get_project_id(project_name: str) -> int:
@@ -30,7 +54,21 @@ def get_project_id(project_name: str) -> int:
     cursor = conn.cursor()
     cursor.execute("SELECT id FROM projects WHERE name = ?", (project_name,))
     row = cursor.fetchone()
-    conn.close()
+    return row[0] if row else -1
+
+# Look up a project id by name, only if the project has no "Done" log entry
+def get_not_done_project_id(project_name: str) -> int:
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT projects.id FROM projects
+        LEFT JOIN project_status AS done ON done.project_id = projects.id AND done.status = 'Done'
+        WHERE projects.name = ? AND done.id IS NULL
+        """,
+        (project_name,),
+    )
+    row = cursor.fetchone()
     return row[0] if row else -1
 
 # Fetch only projects that do not have a "Done" log entry
@@ -38,115 +76,181 @@ def fetch_not_done_projects() -> List[Dict[str, Any]]:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute(
-        "SELECT id, name FROM projects WHERE id NOT IN (SELECT project_id FROM project_status WHERE status = 'Done')"
+        """
+        SELECT projects.id, projects.name FROM projects
+        LEFT JOIN project_status AS done ON done.project_id = projects.id AND done.status = 'Done'
+        WHERE done.id IS NULL
+        """
     )
     rows = cursor.fetchall()
-    conn.close()
     return [{"id": row[0], "name": row[1]} for row in rows]
 
 # Add a new project log entry using projected end date
 def add_log(employee: str, project_id: int, status: str, projected_end_date: datetime.date) -> None:
     now: str = datetime.datetime.now().isoformat()
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        INSERT INTO project_status(employee, project_id, status, commit_time, projected_end_date)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        (employee, project_id, status, now, projected_end_date.isoformat()),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute(SQL_INSERT_LOG, (employee, project_id, status, now, projected_end_date.isoformat()))
+    _bump_logs_version()
+
+# Add many log entries (employee, project_id, status, projected_end_date) in a single transaction
+def add_logs_bulk(rows: List[tuple[str, int, str, datetime.date]]) -> None:
+    now: str = datetime.datetime.now().isoformat()
+    conn = get_connection()
+    with conn:
+        conn.executemany(
+            SQL_INSERT_LOG,
+            [(employee, project_id, status, now, projected_end_date.isoformat())
+             for employee, project_id, status, projected_end_date in rows],
+        )
+    _bump_logs_version()
 
 # Delete a project log entry by id
 def delete_log(log_id: int) -> None:
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM project_status WHERE id = ?", (log_id,))
-    conn.commit()
-    conn.close()
-
-# Fetch all project log entries
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM project_status WHERE id = ?", (log_id,))
+    _bump_logs_version()
+
+LOG_COLUMNS: List[str] = ["id", "employee", "project_name", "status", "commit_time", "projected_end_date"]
+
+# Columns of the logs ui.table; "actions" is filled by the Delete button slot
+LOG_TABLE_COLUMNS: List[Dict[str, Any]] = [
+    {"name": "id", "label": "ID", "field": "id", "align": "left"},
+    {"name": "employee", "label": "Employee", "field": "employee", "align": "left"},
+    {"name": "project_name", "label": "Project", "field": "project_name", "align": "left"},
+    {"name": "status", "label": "Status", "field": "status", "align": "left"},
+    {"name": "commit_time", "label": "Commit Time", "field": "commit_time", "align": "left"},
+    {"name": "projected_end_date", "label": "Projected End", "field": "projected_end_date", "align": "left"},
+    {"name": "actions", "label": "", "field": "id"},
+]
+
+SQL_FETCH_LOGS = """
+    SELECT project_status.id, employee, projects.name AS project_name, status, commit_time, projected_end_date
+    FROM project_status
+    JOIN projects ON project_status.project_id = projects.id
+    ORDER BY commit_time ASC
+"""
+
+# Read all project log entries straight into a DataFrame once per logs version
+@functools.lru_cache(maxsize=1)
+def _fetch_all_logs_df_cached(version: int) -> pd.DataFrame:
+    return _prepare_df(pd.read_sql_query(SQL_FETCH_LOGS, get_connection()))
+
+# The same log entries as dicts, built from the cached DataFrame only when a caller needs them
+@functools.lru_cache(maxsize=1)
+def _fetch_all_logs_cached(version: int) -> List[Dict[str, Any]]:
+    return _fetch_all_logs_df_cached(version)[LOG_COLUMNS].to_dict("records")  # type: ignore
+
+# Attach every derived column the builders need, parsed once
+def _prepare_df(df: pd.DataFrame) -> pd.DataFrame:
+    df["commit_dt"] = pd.to_datetime(df["commit_time"], format="ISO8601", errors="raise")  # type: ignore
+    df["commit_week"] = df["commit_dt"].dt.to_period("W").dt.start_time.dt.date  # type: ignore
+    return df
+
+# Fetch all project log entries (the returned dicts are shared with the cache and must not be mutated)
 def fetch_all_logs() -> List[Dict[str, Any]]:
+    return list(_fetch_all_logs_cached(_logs_version))
+
+# Fetch all project log entries as a DataFrame with parsed "commit_dt" and "commit_week" columns (shared, read-only)
+def fetch_all_logs_df() -> pd.DataFrame:
+    return _fetch_all_logs_df_cached(_logs_version)
+
+# Per (employee, project) start, last "Done" commit and projected end date, aggregated in SQL.
+# FIRST_VALUE takes the projected end date of each group's earliest log, replacing a correlated
+# subquery that looked it up per group; SQLite still sorts for the window, the GROUP BY and the
+# final ORDER BY. Groups without a "Done" log are skipped.
+# The rows are parsed into a durations frame once per logs version.
+@functools.lru_cache(maxsize=1)
+def _fetch_project_durations_cached(version: int) -> pd.DataFrame:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute(
         """
-        SELECT project_status.id, employee, projects.name, status, commit_time, projected_end_date 
-        FROM project_status 
-        JOIN projects ON project_status.project_id = projects.id 
-        ORDER BY commit_time ASC
+        SELECT ps.employee, projects.name, MIN(ps.commit_time) AS start_time,
+               MAX(CASE WHEN ps.status = 'Done' THEN ps.commit_time END) AS finish_time,
+               MIN(ps.first_projected_end_date) AS projected_end_date
+        FROM (
+            SELECT id, employee, project_id, status, commit_time,
+                   FIRST_VALUE(projected_end_date) OVER (
+                       PARTITION BY employee, project_id ORDER BY commit_time ASC, id ASC
+                   ) AS first_projected_end_date
+            FROM project_status
+        ) AS ps
+        JOIN projects ON ps.project_id = projects.id
+        GROUP BY ps.employee, ps.project_id
+        HAVING finish_time IS NOT NULL
+        ORDER BY start_time ASC, MIN(ps.id) ASC
         """
     )
-    rows = cursor.fetchall()
-    conn.close()
-    logs: List[Dict[str, Any]] = []
-    for row in rows:
-        logs.append({
-                "id": row[0],
-                "employee": row[1],
-                "project_name": row[2],
-                "status": row[3],
-                "commit_time": row[4],
-                "projected_end_date": row[5],
-            })
-    return logs
+    return project_durations_frame([tuple(row) for row in cursor.fetchall()])
+
+# Fetch employee, project, actual_duration and projected_duration (hours) for every completed project (shared, read-only)
+def fetch_project_durations() -> pd.DataFrame:
+    return _fetch_project_durations_cached(_logs_version)
+
+# Read everything the status page shows in a single trip to the DB pool. The log-derived pieces all
+# come from the cache entry for one logs version, which is returned alongside them; the not-done
+# projects are read fresh and may be newer than that version.
+def fetch_dashboard_state() -> Dict[str, Any]:
+    version = _logs_version
+    return {
+        "version": version,
+        "logs": list(_fetch_all_logs_cached(version)),
+        "logs_df": _fetch_all_logs_df_cached(version),
+        "durations": _fetch_project_durations_cached(version),
+        "not_done": fetch_not_done_projects(),
+    }
+
+# Actual and projected durations in hours for (employee, project, start_iso, finish_iso, projected_iso) rows
+def project_durations_frame(durations: List[tuple[str, str, str, str, str]]) -> pd.DataFrame:
+    df = pd.DataFrame(durations, columns=["employee", "project", "start_time", "finish_time", "projected_end_date"])
+    start = pd.to_datetime(df["start_time"], format="ISO8601")  # type: ignore
+    finish = pd.to_datetime(df["finish_time"], format="ISO8601")  # type: ignore
+    # Projected duration runs from start to midnight of the projected end date
+    projected = pd.to_datetime(df["projected_end_date"], format="ISO8601")  # type: ignore
+    df["actual_duration"] = (finish - start).dt.total_seconds() / 3600.0
+    df["projected_duration"] = (projected - start).dt.total_seconds() / 3600.0
+    return df[["employee", "project", "actual_duration", "projected_duration"]]
 
 # Compute summary for completed projects (where status is 'Done') by computing durations in hours
-def compute_summary(logs: List[Dict[str, Any]]) -> str:
-    project_groups: Dict[tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
-    for log in logs:
-        key = (log["employee"], log["project_name"])
-        project_groups[key].append(log)
-    
-    summary_lines: List[str] = []
-    for (employee, project), records in project_groups.items():
-        done_records = [r for r in records if r["status"] == "Done"]
-        if done_records:
-            start = min(datetime.datetime.fromisoformat(r["commit_time"]) for r in records)
-            finish = max(datetime.datetime.fromisoformat(r["commit_time"]) for r in done_records)
-            actual_duration = (finish - start).total_seconds() / 3600.0
-
-            # Compute projected duration as hours from start to the projected end date.
-            projected_date = datetime.date.fromisoformat(records[0]["projected_end_date"])
-            projected_dt = datetime.datetime.combine(projected_date, datetime.time.min)
-            projected_duration = (projected_dt - start).total_seconds() / 3600.0
-
-            line = (
-                f"Employee: {employee}, Project: {project}, "
-                f"Projected: {projected_duration:.2f} hrs, Actual: {actual_duration:.2f} hrs"
-            )
-            summary_lines.append(line)
+def compute_summary(durations: pd.DataFrame) -> str:
+    summary_lines: List[str] = [
+        f"Employee: {employee}, Project: {project}, "
+        f"Projected: {projected_duration:.2f} hrs, Actual: {actual_duration:.2f} hrs"
+        for employee, project, actual_duration, projected_duration in zip(
+            durations["employee"], durations["project"], durations["actual_duration"], durations["projected_duration"]
+        )
+    ]
     return "\n".join(summary_lines) if summary_lines else "No completed projects yet."
 
+_STATUS_ICONS: Dict[str, str] = {
+    "Blocked": "⛔",
+    "At Risk": "⚠️",
+    "Off Track": "🚫",
+    "Not Started": "⏸",
+    "In Progress": "🔄",
+    "Canceled": "❌",
+    "Done": "✅",
+}
+
 # Helper function to decorate status with icons
 def decorate_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    icon = {
-        "Blocked": "⛔",
-        "At Risk": "⚠️",
-        "Off Track": "🚫",
-        "Not Started": "⏸",
-        "In Progress": "🔄",
-        "Canceled": "❌",
-        "Done": "✅",
-    }.get(record["status"], "")
-    record["status"] = f"{icon} {record['status']}"
+    record["status"] = f"{_STATUS_ICONS.get(record['status'], '')} {record['status']}"
     return record
 
-# Helper function to get the start date from a Pandas Period representing a week
-def get_period_start_date(period: pd.Period) -> datetime.date:
-    return period.start_time.date()
+# Count commits per (commit week, status)
+def _status_counts(df: pd.DataFrame) -> pd.DataFrame:
+    return df.groupby(["commit_week", "status"], as_index=False).agg(count=("status", "size"))  # type: ignore
 
 # Create a Plotly bar chart of commits per week by status (aggregated by commit week)
-def create_status_graph() -> Any:
-    logs = fetch_all_logs()
-    if logs:
-        df = pd.DataFrame(logs)
-        df["commit_dt"] = pd.to_datetime(df["commit_time"], errors="raise")  # type: ignore
-        period_series = df["commit_dt"].dt.to_period("W")
-        df["commit_week"] = period_series.apply(get_period_start_date)  # type: ignore
-        grouped = df.groupby(["commit_week", "status"], as_index=False).agg(count=("status", "size"))  # type: ignore
+def create_status_graph(df: Optional[pd.DataFrame] = None) -> Any:
+    if df is None:
+        df = fetch_all_logs_df()
+    if not df.empty:
+        grouped = _status_counts(df)
         fig = px.bar(
             grouped,
             x="commit_week",
@@ -162,34 +266,11 @@ def create_status_graph() -> Any:
         return px.bar()  # type: ignore
 
 # Create a Plotly scatter plot comparing actual vs. projected durations for completed projects
-def create_time_vs_projected_graph() -> Any:
-    logs = fetch_all_logs()
-    groups: Dict[tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
-    for log in logs:
-        key = (log["employee"], log["project_name"])
-        groups[key].append(log)
-    records = []
-    for (employee, project), recs in groups.items():
-        done_recs = [r for r in recs if r["status"] == "Done"]
-        if done_recs:
-            start = min(datetime.datetime.fromisoformat(str(r["commit_time"])) for r in recs)
-            finish = max(datetime.datetime.fromisoformat(str(r["commit_time"])) for r in done_recs)
-            actual_duration = (finish - start).total_seconds() / 3600.0
-
-            # Compute projected duration from projected_end_date (difference from start)
-            projected_date = datetime.date.fromisoformat(recs[0]["projected_end_date"])
-            projected_dt = datetime.datetime.combine(projected_date, datetime.time.min)
-            projected_duration = (projected_dt - start).total_seconds() / 3600.0
-
-            records.append({
-                "employee": employee,
-                "project": project,
-                "actual_duration": actual_duration,
-                "projected_duration": projected_duration,
-            })  # type: ignore
+def create_time_vs_projected_graph(df: Optional[pd.DataFrame] = None) -> Any:
+    if df is None:
+        df = fetch_project_durations()
     scatter_func: Any = px.scatter  # type: ignore
-    if records:
-        df = pd.DataFrame(records)
+    if not df.empty:
         fig = scatter_func(
             df,
             x="projected_duration",
@@ -215,19 +296,71 @@ def create_time_vs_projected_graph() -> Any:
     else:
         return scatter_func()  # type: ignore
 
+# Swap new data into the traces of an existing status graph. Returns False when the set of
+# statuses (one trace each) changed, in which case the figure has to be rebuilt.
+def refresh_status_graph(fig: Any, df: pd.DataFrame) -> bool:
+    if df.empty:
+        return False
+    grouped = _status_counts(df)
+    by_status = grouped.groupby("status", sort=False)
+    if [trace.name for trace in fig.data] != list(by_status.groups):
+        return False
+    for trace, (_, group) in zip(fig.data, by_status):
+        trace.x = group["commit_week"].to_numpy()
+        trace.y = group["count"].to_numpy()
+    return True
+
+# Swap new durations into the traces of an existing time-vs-projected graph. Returns False
+# when the set of employees (one trace each, plus the ideal line) changed.
+def refresh_time_vs_projected_graph(fig: Any, df: pd.DataFrame) -> bool:
+    if df.empty:
+        return False
+    by_employee = df.groupby("employee", sort=False)
+    if [trace.name for trace in fig.data] != [*by_employee.groups, "Ideal"]:
+        return False
+    for trace, (_, group) in zip(fig.data, by_employee):
+        trace.x = group["projected_duration"].to_numpy()
+        trace.y = group["actual_duration"].to_numpy()
+        trace.customdata = group[["project"]].to_numpy()
+    fig.data[-1].x = df["projected_duration"]
+    fig.data[-1].y = df["projected_duration"]
+    return True
+
+# Statuses that make a commit-table cell red, and the only statuses allowed in a green cell
+_RED_SET: FrozenSet[str] = frozenset({"Blocked", "At Risk"})
+_GREEN_SET: FrozenSet[str] = frozenset({"In Progress", "Done"})
+
+# Commit-table cell markup for every color determine_color can return, plus "lightgrey" for empty weeks
+_CELL_TEMPLATES: Dict[str, str] = {
+    color: (
+        f'<td style="border: 1px solid #ccc; padding: 4px; text-align: center;">'
+        f'<div style="width: 20px; height: 20px; background-color: {color};"></div></td>'
+    )
+    for color in ("red", "yellow", "green", "white", "lightgrey")
+}
+
+# Pick the commit-table cell color for the set of statuses logged in one (employee, week)
+def determine_color(statuses: FrozenSet[str]) -> str:
+    if not _RED_SET.isdisjoint(statuses):
+        return "red"
+    elif "Off Track" in statuses:
+        return "yellow"
+    elif statuses and statuses <= _GREEN_SET:
+        return "green"
+    else:
+        return "white"
+
 # Create an HTML table of weekly commit statuses
-def create_commit_table() -> str:
-    logs = fetch_all_logs()
-    employees = [emp["name"] for emp in EmployeeManager.fetch_employees()]
+def create_commit_table(df: Optional[pd.DataFrame] = None, employees: Optional[List[str]] = None) -> str:
+    if df is None:
+        df = fetch_all_logs_df()
+    if employees is None:
+        employees = [emp["name"] for emp in EmployeeManager.fetch_employees()]
     week_list: List[datetime.date] = []
-    if logs:
-        df = pd.DataFrame(logs)
-        df["commit_dt"] = pd.to_datetime(df["commit_time"], errors="raise")  # type: ignore
-        period_series = df["commit_dt"].dt.to_period("W")
-        df["commit_week"] = period_series.apply(get_period_start_date)  # type: ignore
-        start_week: datetime.date = pd.to_datetime(df["commit_week"].min()).date()  # type: ignore
-        end_week: datetime.date = pd.to_datetime(df["commit_week"].max()).date()  # type: ignore
-        current: datetime.date = cast(datetime.date, start_week)
+    if not df.empty:
+        start_week: datetime.date = df["commit_week"].min()  # type: ignore
+        end_week: datetime.date = df["commit_week"].max()  # type: ignore
+        current: datetime.date = start_week
         while current <= end_week:
             week_list.append(current)  # type: ignore
             current += datetime.timedelta(days=7)
@@ -235,42 +368,25 @@ def create_commit_table() -> str:
         today = datetime.date.today()
         week_list = [today]
 
-    # Build dictionary mapping (employee, week) to list of statuses
-    status_by_emp_week: Dict[tuple[str, datetime.date], List[str]] = {}
-    if logs:
-        for _, row in df.iterrows():  # type: ignore
-            employee_val: str = str(row["employee"])
-            commit_week_val: datetime.date = pd.to_datetime(row["commit_week"]).date()  # type: ignore
-            key: tuple[str, datetime.date] = (employee_val, commit_week_val)
-            status_by_emp_week.setdefault(key, []).append(row["status"])  # type: ignore
-
-    def determine_color(statuses: List[str]) -> str:
-        if any(s in {"Blocked", "At Risk"} for s in statuses):
-            return "red"
-        elif any(s == "Off Track" for s in statuses):
-            return "yellow"
-        elif statuses and all(s in {"In Progress", "Done"} for s in statuses):
-            return "green"
-        else:
-            return "white"
+    # Build dictionary mapping (employee, week) to the set of statuses logged that week
+    status_by_emp_week: Dict[tuple[str, datetime.date], FrozenSet[str]] = {}
+    if not df.empty:
+        status_by_emp_week = df.groupby(["employee", "commit_week"], sort=False)["status"].agg(frozenset).to_dict()  # type: ignore
 
-    # Build HTML table
-    html = '<table style="border-collapse: collapse;">'
-    html += '<tr><th style="border: 1px solid #ccc; padding: 4px;">Employee</th>'
-    for week in week_list:
-        html += f'<th style="border: 1px solid #ccc; padding: 4px;">{week.strftime("%Y-%m-%d")}</th>'
-    html += '</tr>'
+    # Build HTML table (collected in a list and joined once)
+    parts: List[str] = ['<table style="border-collapse: collapse;">']
+    parts.append('<tr><th style="border: 1px solid #ccc; padding: 4px;">Employee</th>')
+    parts.extend(f'<th style="border: 1px solid #ccc; padding: 4px;">{week.strftime("%Y-%m-%d")}</th>' for week in week_list)
+    parts.append('</tr>')
 
     for emp in employees:
-        html += f'<tr><td style="border: 1px solid #ccc; padding: 4px;">{emp}</td>'
+        parts.append(f'<tr><td style="border: 1px solid #ccc; padding: 4px;">{html.escape(emp)}</td>')
         for week in week_list:
-            statuses = status_by_emp_week.get((emp, week), [])
-            color = determine_color(statuses) if statuses else "lightgrey"
-            html += f'<td style="border: 1px solid #ccc; padding: 4px; text-align: center;">'
-            html += f'<div style="width: 20px; height: 20px; background-color: {color};"></div></td>'
-        html += '</tr>'
-    html += '</table>'
-    return html
+            statuses = status_by_emp_week.get((emp, week), frozenset())
+            parts.append(_CELL_TEMPLATES[determine_color(statuses) if statuses else "lightgrey"])
+        parts.append('</tr>')
+    parts.append('</table>')
+    return "".join(parts)
 
 # Create a new function to build an HTML table of all projects
 def create_project_table() -> str:
@@ -280,22 +396,22 @@ def create_project_table() -> str:
     projects = fetch_projects()
     if not projects:
         return "<p>No projects available</p>"
-    html = '<table style="border-collapse: collapse;">'
-    html += (
+    parts: List[str] = [
+        '<table style="border-collapse: collapse;">'
         '<tr>'
         '<th style="border: 1px solid #ccc; padding: 4px;">ID</th>'
         '<th style="border: 1px solid #ccc; padding: 4px;">Project Name</th>'
         '</tr>'
+    ]
+    parts.extend(
+        f'<tr>'
+        f'<td style="border: 1px solid #ccc; padding: 4px;">{proj["id"]}</td>'
+        f'<td style="border: 1px solid #ccc; padding: 4px;">{html.escape(proj["name"])}</td>'
+        f'</tr>'
+        for proj in projects
     )
-    for proj in projects:
-        html += (
-            f'<tr>'
-            f'<td style="border: 1px solid #ccc; padding: 4px;">{proj["id"]}</td>'
-            f'<td style="border: 1px solid #ccc; padding: 4px;">{proj["name"]}</td>'
-            f'</tr>'
-        )
-    html += '</table>'
-    return html
+    parts.append('</table>')
+    return "".join(parts)
 
 # --- Class-based UI ---
 
@@ -311,25 +427,49 @@ class ProjectTracker:
         self.time_graph: Any = None
         self.summary_label: Any = None
         self.commit_table: Any = None
-        self.logs_container: Any = None
+        self.logs_table: Any = None
         self.project_table: Any = None
 
-    @staticmethod
-    def init_db() -> None:
-        init_db()
+        # Name -> id of the projects currently offered in project_select
+        self._project_cache: Dict[str, int] = {}
+        # Employee names, rebuilt only when EmployeeManager's version moves
+        self._employees_cache: Optional[List[str]] = None
+        self._employees_version: int = -1
+        # View name -> data version it was last rendered from, so unchanged views are skipped
+        self._rendered_versions: Dict[str, Any] = {}
+
+    # Whether a view already shows the given data version
+    def _is_rendered(self, view: str, version: Any) -> bool:
+        return self._rendered_versions.get(view) == version
+
+    # Record the version a view now shows; only called once its render has succeeded
+    def _mark_rendered(self, view: str, version: Any) -> None:
+        self._rendered_versions[view] = version
+
+    def _get_employees(self) -> List[str]:
+        version = EmployeeManager.employees_version()
+        if self._employees_cache is None or version != self._employees_version:
+            self._employees_cache = [emp["name"] for emp in EmployeeManager.fetch_employees()]
+            self._employees_version = version
+        return self._employees_cache
 
     def update_employee_select(self) -> None:
-        options = [emp["name"] for emp in EmployeeManager.fetch_employees()]
         if self.employee_select:
-            self.employee_select.options = options
+            self.employee_select.options = self._get_employees()
             self.employee_select.update()
 
-    def update_project_select(self) -> None:
+    def update_project_select(self, not_done: Optional[List[Dict[str, Any]]] = None) -> None:
         if self.project_select:
-            self.project_select.options = [p["name"] for p in fetch_not_done_projects()]
+            self.project_select.options = self.load_not_done_projects(not_done)
             self.project_select.update()
 
-    def submit_log(self) -> None:
+    def load_not_done_projects(self, not_done: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        if not_done is None:
+            not_done = fetch_not_done_projects()
+        self._project_cache = {p["name"]: p["id"] for p in not_done}
+        return list(self._project_cache)
+
+    async def submit_log(self) -> None:
         assert self.employee_select is not None, "employee_select is not set"
         assert self.project_select is not None, "project_select is not set"
         assert self.status_select is not None, "status_select is not set"
@@ -344,73 +484,137 @@ class ProjectTracker:
             ui.notify("Invalid projected end date", color="error")
             return
 
-        proj_obj = next((p for p in fetch_not_done_projects() if p["name"] == project_name), None)
-        if emp and project_name and proj_obj is not None:
-            add_log(emp, proj_obj["id"], stat, proj_end_date)
-            self.update_ui()
-            self.update_project_select()
+        proj_id = self._project_cache.get(project_name, -1)
+        if proj_id == -1 and project_name:
+            proj_id = await run_db(get_not_done_project_id, project_name)
+        if emp and project_name and proj_id != -1:
+            await run_db(add_log, emp, proj_id, stat, proj_end_date)
+            await self.update_status_page()
         else:
             ui.notify("Invalid log submission", color="warning")
 
-    def submit_new_project(self) -> None:
+    async def submit_new_project(self) -> None:
         if self.new_project_input and self.new_project_input.value:
-            add_project(self.new_project_input.value)
+            await run_db(add_project, self.new_project_input.value)
             self.new_project_input.value = ""
             ui.notify("Project created successfully", color="positive")
-            self.update_project_select()
-            self.update_project_table()
+            await self.update_project_page()
         else:
             ui.notify("Please enter a project name", color="warning")
 
-    def update_commit_table(self) -> None:
+    # The log-driven updaters take the logs version their data was read at. When it is omitted the
+    # current version is read before fetching, so a newer write is never marked as rendered.
+    def update_commit_table(self, df: Optional[pd.DataFrame] = None, version: Optional[int] = None) -> None:
         if self.commit_table:
-            self.commit_table.content = create_commit_table()
-
-    def update_project_table(self) -> None:
+            if version is None:
+                version = _logs_version
+            employees = self._get_employees()
+            key = (version, self._employees_version)
+            if self._is_rendered("commit_table", key):
+                return
+            self.commit_table.content = create_commit_table(df, employees)
+            self._mark_rendered("commit_table", key)
+
+    def update_project_table(self, projects: Optional[List[Dict[str, Any]]] = None, version: Optional[int] = None) -> None:
         if self.project_table:
-            self.project_table.rows = fetch_projects()
-
-    def update_summary(self) -> None:
-        logs = fetch_all_logs()
-        summary = compute_summary(logs)
+            if version is None:
+                version = _projects_version
+            if self._is_rendered("project_table", version):
+                return
+            if projects is None:
+                projects = fetch_projects()
+            self.project_table.rows = projects
+            self._mark_rendered("project_table", version)
+
+    def update_summary(self, durations: Optional[pd.DataFrame] = None, version: Optional[int] = None) -> None:
         if self.summary_label:
-            self.summary_label.content = summary
-
-    def update_logs_table(self) -> None:
-        if self.logs_container:
-            self.logs_container.clear()
-            logs = fetch_all_logs()
-            with self.logs_container:
-                for rec in logs:
-                    drec = decorate_record(rec.copy())
-                    with ui.row().classes("items-center q-pa-xs"):
-                        ui.label(str(drec["id"])).classes("w-10")
-                        ui.label(drec["employee"]).classes("w-20")
-                        ui.label(drec["project_name"]).classes("w-40")
-                        ui.label(drec["status"]).classes("w-30")
-                        ui.label(drec["commit_time"]).classes("w-60")
-                        ui.label(drec["projected_end_date"]).classes("w-20")
-                        ui.button(
-                            "Delete",
-                            on_click=lambda e, rec_id=drec["id"]: self.delete_and_update(rec_id)
-                        ).classes("bg-red text-white q-ml-md")
-
-    def delete_and_update(self, rec_id: int) -> None:
-        delete_log(rec_id)
-        self.update_ui()
-
-    def update_graphs(self) -> None:
+            if version is None:
+                version = _logs_version
+            if self._is_rendered("summary", version):
+                return
+            if durations is None:
+                durations = fetch_project_durations()
+            self.summary_label.content = compute_summary(durations)
+            self._mark_rendered("summary", version)
+
+    def update_logs_table(self, logs: Optional[List[Dict[str, Any]]] = None, version: Optional[int] = None) -> None:
+        if self.logs_table:
+            if version is None:
+                version = _logs_version
+            if self._is_rendered("logs_table", version):
+                return
+            if logs is None:
+                logs = fetch_all_logs()
+            # decorate_record mutates, so decorate copies rather than the cached dicts
+            self.logs_table.rows = [decorate_record(dict(log)) for log in logs]
+            self._mark_rendered("logs_table", version)
+
+    def create_logs_table(self) -> None:
+        self.logs_table = ui.table(
+            columns=LOG_TABLE_COLUMNS,
+            rows=[],
+            row_key="id",
+            pagination=0,
+        ).props("virtual-scroll").style("max-height: 600px").classes("q-mt-md")
+        self.logs_table.add_slot("body-cell-actions", """
+            <q-td :props="props">
+                <q-btn label="Delete" class="bg-red text-white" size="sm"
+                    @click="() => $parent.$emit('delete', props.row.id)" />
+            </q-td>
+        """)
+        self.logs_table.on("delete", lambda e: self.delete_and_update(e.args))
+        self.update_logs_table()
+
+    async def delete_and_update(self, rec_id: int) -> None:
+        await run_db(delete_log, rec_id)
+        await self.update_status_page()
+
+    def update_graphs(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        durations: Optional[pd.DataFrame] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        if version is None:
+            version = _logs_version
+        # The commit table also follows the employees, so it keeps its own check
+        self.update_commit_table(df, version)
+        if self._is_rendered("graphs", version):
+            return
+        if df is None:
+            df = fetch_all_logs_df()
+        if durations is None:
+            durations = fetch_project_durations()
+        # Mutate the existing traces when possible; rebuild through plotly express only when the trace set changes
         if self.status_graph:
-            self.status_graph.figure = create_status_graph()
+            if refresh_status_graph(self.status_graph.figure, df):
+                self.status_graph.update()
+            else:
+                self.status_graph.update_figure(create_status_graph(df))
         if self.time_graph:
-            self.time_graph.figure = create_time_vs_projected_graph()
-        self.update_commit_table()
-
-    def update_ui(self) -> None:
-        self.update_graphs()
-        self.update_summary()
-        self.update_logs_table()
-        self.update_project_table()
+            if refresh_time_vs_projected_graph(self.time_graph.figure, durations):
+                self.time_graph.update()
+            else:
+                self.time_graph.update_figure(create_time_vs_projected_graph(durations))
+        self._mark_rendered("graphs", version)
+
+    # Refresh the log-driven views (graphs, summary, commit table, logs and project select) after a log changes
+    async def update_status_page(self) -> None:
+        # Read the dashboard once, off the event loop, and hand the same snapshot to every view
+        state = await run_db(fetch_dashboard_state)
+        self.update_graphs(state["logs_df"], state["durations"], state["version"])
+        self.update_summary(state["durations"], state["version"])
+        self.update_logs_table(state["logs"], state["version"])
+        self.update_project_select(state["not_done"])
+
+    # Refresh the project views (select options and projects table) after a project changes
+    async def update_project_page(self) -> None:
+        if self.project_select:
+            self.update_project_select(await run_db(fetch_not_done_projects))
+        # Check the version first so an up-to-date projects table costs no query
+        version = _projects_version
+        if self.project_table and not self._is_rendered("project_table", version):
+            self.update_project_table(await run_db(fetch_projects), version)
 
     def create_ui(self) -> None:
         with theme.frame("Project Tracker"):
@@ -421,11 +625,11 @@ class ProjectTracker:
                     with ui.card().classes("q-pa-md"):
                         ui.label("Add New Log Entry").classes("text-h6")
                         self.employee_select = ui.select(
-                            options=[emp["name"] for emp in EmployeeManager.fetch_employees()],
+                            options=self._get_employees(),
                             label="Employee",
                         )
                         self.project_select = ui.select(
-                            options=[p["name"] for p in fetch_not_done_projects()],
+                            options=self.load_not_done_projects(),
                             label="Project",
                         )
                         self.status_select = ui.select(
@@ -442,32 +646,34 @@ class ProjectTracker:
                     with ui.card().classes("q-pa-md q-mt-md"):
                         ui.label("Projects List").classes("text-h6")
                         self.project_table = ui.table(
-                            rows=fetch_projects(),
+                            rows=[],
                             columns=[
                                 {"name": "id", "label": "ID", "field": "id", "align": "left"},
                                 {"name": "name", "label": "Project Name", "field": "name", "align": "left"},
                             ],
                         ).classes("q-mt-md")
+                        self.update_project_table()
                 with ui.column():
                     # --- Plots and Tables Section ---
                     with ui.card().classes("q-pa-md"):
                         ui.label("Project Results").classes("text-h6")
-                        self.status_graph = ui.plotly(create_status_graph()).classes("q-mt-md")
-                        self.time_graph = ui.plotly(create_time_vs_projected_graph()).classes("q-mt-md")
+                        self.status_graph = ui.plotly(px.bar()).classes("q-mt-md")
+                        self.time_graph = ui.plotly(px.scatter()).classes("q-mt-md")
                         self.summary_label = ui.markdown("").classes("q-mt-md")
+                        self.update_summary()
                     with ui.card().classes("q-pa-md q-mt-md"):
                         ui.label("Commit Table").classes("text-h6")
-                        self.commit_table = ui.html(create_commit_table()).classes("q-mt-md")
+                        self.commit_table = ui.html("").classes("q-mt-md")
+                        # Fill the graphs and commit table through the updaters so they record the version they show
+                        self.update_graphs()
                     with ui.card().classes("q-pa-md q-mt-md"):
                         ui.label("Project Logs").classes("text-h6")
-                        self.logs_container = ui.column().classes("q-mt-md")
-                        self.update_logs_table()
+                        self.create_logs_table()
 
 # Removed unified page; now splitting into two pages below.
 
 def status_updates_page() -> None:
     tracker = ProjectTracker()
-    ProjectTracker.init_db()
     with theme.frame("Project Tracker - Status Updates"):
         ui.label("Project Status Updates").classes("text-h3 q-pa-md")
         with ui.row():
@@ -475,11 +681,11 @@ def status_updates_page() -> None:
                 with ui.card().classes("q-pa-md"):
                     ui.label("Add New Log Entry").classes("text-h6")
                     tracker.employee_select = ui.select(
-                        options=[emp["name"] for emp in EmployeeManager.fetch_employees()],
+                        options=tracker._get_employees(),
                         label="Employee"
                     )
                     tracker.project_select = ui.select(
-                        options=[p["name"] for p in fetch_not_done_projects()],
+                        options=tracker.load_not_done_projects(),
                         label="Project"
                     )
                     tracker.status_select = ui.select(
@@ -492,20 +698,21 @@ def status_updates_page() -> None:
             with ui.column():
                 with ui.card().classes("q-pa-md"):
                     ui.label("Project Results").classes("text-h6")
-                    tracker.status_graph = ui.plotly(create_status_graph()).classes("q-mt-md")
-                    tracker.time_graph = ui.plotly(create_time_vs_projected_graph()).classes("q-mt-md")
+                    tracker.status_graph = ui.plotly(px.bar()).classes("q-mt-md")
+                    tracker.time_graph = ui.plotly(px.scatter()).classes("q-mt-md")
                     tracker.summary_label = ui.markdown("").classes("q-mt-md")
+                    tracker.update_summary()
                 with ui.card().classes("q-pa-md q-mt-md"):
                     ui.label("Commit Table").classes("text-h6")
-                    tracker.commit_table = ui.html(create_commit_table()).classes("q-mt-md")
+                    tracker.commit_table = ui.html("").classes("q-mt-md")
+                    # Fill the graphs and commit table through the updaters so they record the version they show
+                    tracker.update_graphs()
                 with ui.card().classes("q-pa-md q-mt-md"):
                     ui.label("Project Logs").classes("text-h6")
-                    tracker.logs_container = ui.column().classes("q-mt-md")
-                    tracker.update_logs_table()
+                    tracker.create_logs_table()
 
 def project_list_page() -> None:
     tracker = ProjectTracker()
-    ProjectTracker.init_db()
     with theme.frame("Project Tracker - Projects List"):
         ui.label("Projects List").classes("text-h3 q-pa-md")
         with ui.card().classes("q-pa-md"):
@@ -515,10 +722,11 @@ def project_list_page() -> None:
         with ui.card().classes("q-pa-md q-mt-md"):
             ui.label("Projects List").classes("text-h6")
             tracker.project_table = ui.table(
-                rows=fetch_projects(),
+                rows=[],
                 columns=[
                     {"name": "id", "label": "ID", "field": "id", "align": "left"},
                     {"name": "name", "label": "Project Name", "field": "name", "align": "left"},
                 ],
             ).classes("q-mt-md")
+            tracker.update_project_table()
 